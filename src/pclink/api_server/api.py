@@ -70,6 +70,9 @@ def create_api_app(controller_instance, connected_devices: Dict) -> FastAPI:
         except Exception as e:
             log.error(f"Startup restoration failed: {e}")
 
+        # Discovery beacon runs as a task on this loop
+        controller_instance.attach_event_loop(asyncio.get_running_loop())
+
         # Start WebSocket Broadcast Task
         from .routers.websocket_routes import broadcast_updates_task
         from ..services.system_service import system_service
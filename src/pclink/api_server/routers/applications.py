@@ -2,12 +2,13 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # Copyright (C) 2025 AZHAR ZOUHIR / BYTEDz
 
+import asyncio
 import logging
 import platform
 from typing import List, Optional
 
 from fastapi import APIRouter
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
 
 from ...services.app_service import app_service
@@ -29,8 +30,9 @@ class AppLaunchPayload(BaseModel):
 
 @router.get("", response_model=List[Application])
 async def get_applications(force_refresh: bool = False):
-    apps = await app_service.get_applications(force_refresh)
-    return [Application(**a) for a in apps]
+    # Cached list is already in Application shape; skip per-request re-encoding
+    content = await app_service.get_applications_json(force_refresh)
+    return Response(content=content, media_type="application/json")
 
 
 @router.post("/launch")
@@ -47,7 +49,7 @@ async def get_application_icon(path: str):
         raise ValueError("Invalid path")
 
     if platform.system() == "Linux":
-        icon = app_service.find_linux_icon(path)
+        icon = await asyncio.to_thread(app_service.find_linux_icon, path)
         if icon:
             return FileResponse(icon)
 
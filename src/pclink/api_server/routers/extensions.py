@@ -2,17 +2,20 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # Copyright (C) 2025 AZHAR ZOUHIR / BYTEDz
 
+import asyncio
 import gettext
 import logging
 import os
 import shutil
 import tempfile
+import threading
 import urllib.request
 from pathlib import Path
+from stat import S_ISREG
 from typing import Any, Dict, Optional, Tuple
 
 from fastapi import APIRouter, File, HTTPException, Query, Request, UploadFile
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 
 from ...core.config import config_manager
 from ...core.extension_manager import DANGEROUS_PERMISSIONS, ExtensionManager
@@ -26,6 +29,11 @@ extension_manager = ExtensionManager()
 mgmt_router = APIRouter(tags=["extension-management"])
 runtime_router = APIRouter(tags=["extension-runtime"])
 
+# extension_id -> realpath of its directory, resolved once per extension
+_resolved_ext_dirs: Dict[str, Path] = {}
+# extension_id -> (manifest, {widget_id: widget}) rebuilt when the manifest reloads
+_widget_indexes: Dict[str, Tuple[dict, Dict[str, dict]]] = {}
+
 
 def _ensure_extensions_enabled():
     if not config_manager.get("allow_extensions", False):
@@ -46,11 +54,30 @@ def _resolve_extension_path_and_manifest(
     extension_id: str,
 ) -> Tuple[Path, Optional[dict]]:
     """Helper to resolve extension filesystem path and manifest dict reliably."""
-    ext_dir = (extension_manager.extensions_path / extension_id).resolve()
     manifest = extension_manager.get_manifest(extension_id)
+    ext_dir = _resolved_ext_dirs.get(extension_id)
+    if ext_dir is None:
+        ext_dir = (extension_manager.extensions_path / extension_id).resolve()
+        if manifest:
+            # Only real extensions are cached so arbitrary ids can't grow the map
+            _resolved_ext_dirs[extension_id] = ext_dir
     return ext_dir, manifest
 
 
+def _get_widget_index(extension_id: str, manifest: dict) -> Dict[str, dict]:
+    """Returns the id -> widget map for a manifest, cached per manifest object."""
+    cached = _widget_indexes.get(extension_id)
+    if cached and cached[0] is manifest:
+        return cached[1]
+    index = {}
+    for w in manifest.get("dashboard_widgets") or []:
+        if isinstance(w, dict):
+            # First widget wins on duplicate ids, as the linear lookup did
+            index.setdefault(w.get("id"), w)
+    _widget_indexes[extension_id] = (manifest, index)
+    return index
+
+
 @mgmt_router.get("/")
 @mgmt_router.get("")
 async def list_extensions():
@@ -117,10 +144,10 @@ async def install_extension(file: UploadFile = File(...)):
     if not file.filename.endswith(".zip"):
         raise HTTPException(400, _("Only .zip allowed"))
     with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp:
-        shutil.copyfileobj(file.file, tmp)
+        await asyncio.to_thread(shutil.copyfileobj, file.file, tmp, 1024 * 1024)
         tmp_p = Path(tmp.name)
     try:
-        if extension_manager.install_extension(tmp_p):
+        if await asyncio.to_thread(extension_manager.install_extension, tmp_p):
             return {"status": "success"}
         raise HTTPException(400, _("Install failed"))
     except PermissionError as e:
@@ -136,8 +163,6 @@ async def install_extension_from_url(url: str = Query(...)):
     if not url.startswith("http"):
         raise HTTPException(400, _("Invalid URL"))
 
-    import threading
-
     task_id = f"url-{abs(hash(url))}"
 
     extension_manager.install_states[task_id] = {
@@ -265,7 +290,7 @@ async def get_ui(extension_id: str, token: str = Query(None)):
         raise HTTPException(404, _("UI entry point not specified"))
 
     ui_p = (ext_dir / ui_entry).resolve()
-    if not str(ui_p).startswith(str(ext_dir.resolve())) or not ui_p.exists():
+    if not ui_p.is_relative_to(ext_dir) or not ui_p.exists():
         raise HTTPException(404, _("UI entry file missing"))
 
     res = FileResponse(ui_p, media_type="text/html")
@@ -289,8 +314,7 @@ async def get_widget_ui(extension_id: str, widget_id: str, token: str = Query(No
     if not manifest:
         raise HTTPException(404, _("Extension not found"))
 
-    widgets = manifest.get("dashboard_widgets", [])
-    widget = next((w for w in widgets if w.get("id") == widget_id), None)
+    widget = _get_widget_index(extension_id, manifest).get(widget_id)
     if not widget:
         raise HTTPException(404, _("Widget not found"))
 
@@ -299,7 +323,7 @@ async def get_widget_ui(extension_id: str, widget_id: str, token: str = Query(No
         raise HTTPException(404, _("Widget UI entry missing"))
 
     ui_p = (ext_dir / ui_entry).resolve()
-    if not str(ui_p).startswith(str(ext_dir.resolve())) or not ui_p.exists():
+    if not ui_p.is_relative_to(ext_dir) or not ui_p.exists():
         raise HTTPException(404, _("Widget UI missing"))
 
     res = FileResponse(ui_p, media_type="text/html")
@@ -326,20 +350,30 @@ async def get_icon(extension_id: str):
         raise HTTPException(404, _("No icon specified in extension manifest"))
 
     icon_p = (ext_dir / icon_rel).resolve()
-    if not str(icon_p).startswith(str(ext_dir.resolve())) or not icon_p.exists():
+    if not icon_p.is_relative_to(ext_dir) or not icon_p.exists():
         raise HTTPException(404, _("Icon file not found"))
 
     return FileResponse(icon_p)
 
 
 @runtime_router.get("/{extension_id}/static/{file_path:path}")
-async def get_static(extension_id: str, file_path: str):
+async def get_static(extension_id: str, file_path: str, request: Request):
     ext_dir, _ = _resolve_extension_path_and_manifest(extension_id)
     base = (ext_dir / "static").resolve()
     target = (base / file_path).resolve()
-    if not str(target).startswith(str(base)) or not target.is_file():
-        raise HTTPException(403 if target.exists() else 404)
-    return FileResponse(target)
+    try:
+        st = target.stat()
+    except OSError:
+        st = None
+    if not target.is_relative_to(base) or st is None or not S_ISREG(st.st_mode):
+        raise HTTPException(403 if st is not None else 404)
+
+    # Revalidate on every load; unchanged assets come back as a bodiless 304
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(target, stat_result=st, headers=headers)
 
 
 # Dynamic IPC HTTP Gateway Handler for Process-Isolated Extension Endpoints
@@ -7,10 +7,8 @@ import gettext
 import json
 import logging
 import mimetypes
-import os
-import subprocess
-import sys
 import urllib.parse
+from stat import S_ISREG
 from typing import List, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
@@ -18,7 +16,7 @@ from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from ...core.share_manager import share_manager
-from ...services.file_service import HOME_DIR, file_service
+from ...services.file_service import HOME_DIR, STREAM_CHUNK_SIZE, file_service
 from .dependencies import extract_token, verify_api_key, verify_web_session
 
 log = logging.getLogger(__name__)
@@ -99,6 +97,27 @@ class ExtractPayload(BaseModel):
 
 
 # --- Helpers ---
+async def _iterate_in_thread(gen):
+    """Drive a blocking progress generator from a worker thread."""
+    done = object()
+    pending = None
+    try:
+        while True:
+            pending = asyncio.ensure_future(asyncio.to_thread(next, gen, done))
+            # Shielded: on disconnect the step still finishes before close()
+            prog = await asyncio.shield(pending)
+            pending = None
+            if prog is done:
+                return
+            yield prog
+    finally:
+        if pending is not None:
+            await asyncio.gather(pending, return_exceptions=True)
+        # Run the generator's cleanup off the loop rather than wherever its
+        # last reference happens to be dropped
+        await asyncio.to_thread(gen.close)
+
+
 async def verify_download_access(
     path: str = Query(...),
     token: str = Query(None),
@@ -169,8 +188,7 @@ async def browse_directory(path: str | None = Query(None)):
     p = file_service.validate_path(path)
     items = await file_service.scan_directory(p)
 
-    is_root = any(str(p) == str(r) for r in file_service.get_system_roots())
-    parent = str(p.parent) if not is_root else ROOT_IDENTIFIER
+    parent = ROOT_IDENTIFIER if file_service.is_system_root(p) else str(p.parent)
 
     try:
         if HOME_DIR.exists() and p.samefile(HOME_DIR):
@@ -179,11 +197,9 @@ async def browse_directory(path: str | None = Query(None)):
         if p == HOME_DIR:
             parent = ROOT_IDENTIFIER
 
-    return DirectoryListing(
-        current_path=str(p),
-        parent_path=parent,
-        items=[FileItem(**i) for i in items],
-    )
+    # Plain dict: response_model validates it once, instead of building
+    # FileItem models here only for FastAPI to dump and re-validate them
+    return {"current_path": str(p), "parent_path": parent, "items": items}
 
 
 @router.get("/thumbnail", dependencies=[Depends(verify_api_key)])
@@ -261,7 +277,8 @@ async def compress(payload: CompressPayload):
     async def _stream():
         try:
             gen = await file_service.compress(payload.file_paths, payload.output_path)
-            for prog in gen:
+            # Compression is CPU-bound; keep it off the event loop
+            async for prog in _iterate_in_thread(gen):
                 yield f"data: {json.dumps({'progress': prog})}\n\n"
             yield f"data: {json.dumps({'status': 'complete', 'progress': 100})}\n\n"
         except Exception as e:
@@ -279,7 +296,7 @@ async def extract(payload: ExtractPayload):
                 payload.destination, check_existence=False
             )
             gen = await file_service.extract(p, dest, payload.password)
-            for prog in gen:
+            async for prog in _iterate_in_thread(gen):
                 yield f"data: {json.dumps({'progress': prog})}\n\n"
             yield f"data: {json.dumps({'status': 'complete', 'progress': 100})}\n\n"
         except Exception as e:
@@ -319,19 +336,7 @@ async def delete(payload: PathsPayload):
 @router.post("/open", dependencies=[Depends(verify_api_key)])
 async def open_file(payload: PathPayload):
     p = file_service.validate_path(payload.path)
-    if sys.platform == "win32":
-        await asyncio.to_thread(os.startfile, p)
-    elif sys.platform == "darwin":
-        subprocess.Popen(
-            ["open", str(p)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        )
-    else:
-        subprocess.Popen(
-            ["xdg-open", str(p)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True,
-        )
+    await file_service.open_path(p)
     return {"status": "success"}
 
 
@@ -455,9 +460,17 @@ async def share_file(payload: SharePayload, request: Request):
 @router.get("/download", dependencies=[Depends(verify_download_access)])
 async def download(path: str = Query(...)):
     p = file_service.validate_path(path)
-    if not p.is_file():
+    st = p.stat()
+    if not S_ISREG(st.st_mode):
         raise ValueError(_("Requested path is not a file"))
 
-    return FileResponse(
-        path=str(p), filename=p.name, content_disposition_type="attachment"
+    # Passing the stat result spares FileResponse its own stat() call
+    response = FileResponse(
+        path=str(p),
+        filename=p.name,
+        content_disposition_type="attachment",
+        stat_result=st,
     )
+    # Starlette reads 64 KiB per thread hop by default
+    response.chunk_size = STREAM_CHUNK_SIZE
+    return response
@@ -18,6 +18,9 @@ from ...core.device_manager import device_manager
 log = logging.getLogger(__name__)
 router = APIRouter()
 
+# Each relayed chunk costs a threadpool hop; 8 KiB made that the bottleneck
+PROXY_CHUNK_SIZE = 256 * 1024
+
 
 def get_active_phone_details(
     target_device_id: Optional[str] = None,
@@ -227,7 +230,7 @@ async def proxy_webdav(request: Request, path: str):
 
             def generate():
                 try:
-                    for chunk in resp.iter_content(chunk_size=8192):
+                    for chunk in resp.iter_content(chunk_size=PROXY_CHUNK_SIZE):
                         yield chunk
                 finally:
                     resp.close()
@@ -4,8 +4,10 @@
 
 import asyncio
 import logging
+import os
 import socket
 import sys
+import threading
 import time
 from typing import Optional
 
@@ -397,12 +399,8 @@ async def shutdown_server(request: Request):
                 if controller and hasattr(controller, "stop_server_completely"):
                     controller.stop_server_completely()
             finally:
-                import os
-
                 os._exit(0)
 
-        import threading
-
         threading.Timer(0.5, do_shutdown).start()
         return {"status": "success", "message": "Shutting down..."}
     except Exception as e:
@@ -42,6 +42,13 @@ download_router = APIRouter()
 MAX_CHUNK_TOLERANCE = UPLOAD_CHUNK_SIZE * 2  # Hard limit for memory protection
 
 
+def _chunk_too_large() -> HTTPException:
+    # Built only when raised, keeping it off the per-chunk success path
+    return HTTPException(
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, _("Chunk payload too large")
+    )
+
+
 # --- Auth Helper ---
 async def get_client_id(
     device: Device = Depends(get_authenticated_device),
@@ -149,7 +156,7 @@ async def initiate_upload(
 
 @upload_router.get("/status/{upload_id}")
 async def get_upload_status(upload_id: str, client_id: str = Depends(get_client_id)):
-    meta = await transfer_service.read_metadata(upload_id, "upload")
+    meta = await transfer_service.get_upload_session(upload_id)
     if not meta or not transfer_service.verify_ownership(meta, client_id):
         raise HTTPException(status.HTTP_404_NOT_FOUND, _("Upload not found"))
 
@@ -169,19 +176,36 @@ async def upload_chunk(
     offset: int = Query(...),
     client_id: str = Depends(get_client_id),
 ):
-    meta = await transfer_service.read_metadata(upload_id, "upload")
+    meta = await transfer_service.get_upload_session(upload_id)
     if not meta or not transfer_service.verify_ownership(meta, client_id):
         raise HTTPException(status.HTTP_404_NOT_FOUND, _("Upload not found"))
 
-    data = bytearray()
     try:
-        async for chunk in request.stream():
-            data.extend(chunk)
-            if len(data) > MAX_CHUNK_TOLERANCE:
-                raise HTTPException(
-                    status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    _("Chunk payload too large"),
-                )
+        declared = int(request.headers.get("content-length", ""))
+    except ValueError:
+        declared = None
+
+    try:
+        if declared is not None:
+            if declared > MAX_CHUNK_TOLERANCE:
+                raise _chunk_too_large()
+            # Sized up front: copy each message in place, no regrowth
+            buf = bytearray(declared)
+            view = memoryview(buf)
+            pos = 0
+            async for chunk in request.stream():
+                end = pos + len(chunk)
+                if end > declared:
+                    raise _chunk_too_large()
+                view[pos:end] = chunk
+                pos = end
+            data = buf if pos == declared else view[:pos]
+        else:
+            data = bytearray()
+            async for chunk in request.stream():
+                data.extend(chunk)
+                if len(data) > MAX_CHUNK_TOLERANCE:
+                    raise _chunk_too_large()
     except ClientDisconnect:
         log.warning(f"Client disconnected during chunk upload for {upload_id}")
         return {"status": "interrupted"}
@@ -192,9 +216,11 @@ async def upload_chunk(
         raise HTTPException(status.HTTP_400_BAD_REQUEST, _("Stream read failed"))
 
     try:
-        return await transfer_service.write_chunk(upload_id, offset, bytes(data))
+        return await transfer_service.write_chunk(upload_id, offset, data)
     except BufferError as e:
         raise HTTPException(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, str(e))
+    except FileNotFoundError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, _("Upload not found"))
     except Exception as e:
         log.error(f"Chunk write failed for {upload_id}: {e}", exc_info=True)
         raise HTTPException(
@@ -204,7 +230,7 @@ async def upload_chunk(
 
 @upload_router.post("/complete/{upload_id}")
 async def complete_upload(upload_id: str, client_id: str = Depends(get_client_id)):
-    meta = await transfer_service.read_metadata(upload_id, "upload")
+    meta = await transfer_service.get_upload_session(upload_id)
     if not meta or not transfer_service.verify_ownership(meta, client_id):
         raise HTTPException(status.HTTP_404_NOT_FOUND, _("Upload not found"))
 
@@ -224,17 +250,14 @@ async def complete_upload(upload_id: str, client_id: str = Depends(get_client_id
 async def cancel_upload(
     upload_id: str, bg_tasks: BackgroundTasks, client_id: str = Depends(get_client_id)
 ):
-    meta = await transfer_service.read_metadata(upload_id, "upload")
+    meta = await transfer_service.get_upload_session(upload_id)
     if not meta or not transfer_service.verify_ownership(meta, client_id):
         raise HTTPException(status.HTTP_404_NOT_FOUND, _("Upload not found"))
 
-    cid = meta.get("client_id")
-    if cid and cid in transfer_service.active_uploads:
-        path = meta.get("final_path")
-        if path:
-            transfer_service.active_uploads[cid].pop(path, None)
+    if meta.get("final_path"):
+        transfer_service.untrack_upload(client_id, meta["final_path"])
 
-    bg_tasks.add_task(transfer_service.cleanup_session, upload_id, "upload")
+    bg_tasks.add_task(transfer_service.cancel_upload, upload_id)
     return {"status": "cancelled"}
 
 
@@ -16,6 +16,7 @@ from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconn
 from ...core.config import config_manager
 from ...core.device_manager import device_manager
 from ...core.logging import log_telemetry_event
+from ...core.utils import json_loads
 from ...services import input_service
 from ..ws_manager import mobile_manager, ui_manager
 from .dependencies import verify_web_session
@@ -183,7 +184,7 @@ async def mobile_websocket_endpoint(websocket: WebSocket, token: str = Query(Non
             # --- JSON Text Frame Fallback ---
             if "text" in message and message["text"]:
                 try:
-                    data = json.loads(message["text"])
+                    data = json_loads(message["text"])
                 except (json.JSONDecodeError, TypeError):
                     continue
 
@@ -268,7 +269,7 @@ async def web_ui_websocket_endpoint(websocket: WebSocket):
 
             if "text" in message and message["text"]:
                 try:
-                    data = json.loads(message["text"])
+                    data = json_loads(message["text"])
                 except (json.JSONDecodeError, TypeError):
                     continue
 
@@ -291,22 +292,35 @@ async def broadcast_updates_task(mobile_mgr, ui_mgr, state):
     from ...services import media_service, system_service
     from ...services.discovery_service import DiscoveryService
 
+    server_id = DiscoveryService.generate_server_id()
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+
     while True:
         try:
             if not mobile_mgr.active_connections and not ui_mgr.active_connections:
                 await asyncio.sleep(2)
+                next_tick = loop.time()
                 continue
 
             services = config_manager.get("services", {})
             update_data = {
                 "type": "UPDATE_STATE",
                 "services": services,
-                "server_id": DiscoveryService.generate_server_id(),
+                "server_id": server_id,
             }
 
+            # System and media sources are independent; collect them concurrently
+            sources = {}
             if services.get("info", True):
-                update_data["system"] = await system_service.get_system_info()
-            else:
+                sources["system"] = system_service.get_system_info()
+            if services.get("media", True):
+                sources["media"] = media_service.get_media_info()
+            if sources:
+                results = await asyncio.gather(*sources.values())
+                update_data.update(zip(sources, results))
+
+            if "system" not in update_data:
                 version = (
                     getattr(getattr(state, "controller", None), "version", "unknown")
                     if hasattr(state, "controller")
@@ -317,15 +331,19 @@ async def broadcast_updates_task(mobile_mgr, ui_mgr, state):
                     "platform": platform.system(),
                 }
 
-            if services.get("media", True):
-                update_data["media"] = await media_service.get_media_info()
-
             msg = {"type": "update", "data": update_data}
-            if mobile_mgr.active_connections:
-                await mobile_mgr.broadcast(msg)
-            if ui_mgr.active_connections:
-                await ui_mgr.broadcast(msg)
+            broadcasts = [
+                mgr.broadcast(msg)
+                for mgr in (mobile_mgr, ui_mgr)
+                if mgr.active_connections
+            ]
+            await asyncio.gather(*broadcasts)
         except Exception as e:
             log.error(f"Broadcast task error: {e}")
 
-        await asyncio.sleep(1)
+        # Drift-corrected 1 Hz tick; skip ahead rather than burst when behind
+        next_tick += 1.0
+        now = loop.time()
+        if next_tick < now:
+            next_tick = now
+        await asyncio.sleep(next_tick - now)
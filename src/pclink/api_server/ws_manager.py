@@ -2,6 +2,8 @@ from typing import Any, Dict, List
 
 from fastapi import WebSocket
 
+from ..core.utils import json_dumps_bytes
+
 
 class ConnectionManager:
     def __init__(self):
@@ -55,16 +57,21 @@ class ConnectionManager:
     async def send_to_device(self, device_id: str, message: Dict[str, Any]):
         """Send a message to a specific device."""
         if ws_list := self.device_connections.get(device_id):
+            text = json_dumps_bytes(message).decode("utf-8")
             for socket in ws_list:
                 try:
-                    await socket.send_json(message)
+                    await socket.send_text(text)
                 except Exception:
                     pass
 
     async def broadcast(self, message: Dict[str, Any]):
+        if not self.active_connections:
+            return
+        # Serialize once and fan out the same text frame to every client
+        text = json_dumps_bytes(message).decode("utf-8")
         for connection in self.active_connections[:]:
             try:
-                await connection.send_json(message)
+                await connection.send_text(text)
             except Exception:
                 self.disconnect(connection)
 
@@ -34,6 +34,7 @@ DEVICE_TIMEOUT = 300  # in seconds
 # --- File Names ---
 CONFIG_FILENAME = "config.json"
 MACROS_FILENAME = "macros.json"
+APP_CACHE_FILENAME = "app_cache.json"
 CERT_FILENAME = "cert.pem"
 KEY_FILENAME = "key.pem"
 
@@ -46,6 +47,7 @@ CERT_FILE = APP_DATA_PATH / CERT_FILENAME
 KEY_FILE = APP_DATA_PATH / KEY_FILENAME
 CONFIG_FILE = APP_DATA_PATH / CONFIG_FILENAME
 MACROS_FILE = APP_DATA_PATH / MACROS_FILENAME
+APP_CACHE_FILE = APP_DATA_PATH / APP_CACHE_FILENAME
 ASSETS_PATH = Path(__file__).parent.parent / "assets"
 
 # --- Transfer Paths ---
@@ -69,6 +69,8 @@ class ServerController:
         self.control_api_server = None
         self.control_api_thread = None
         self.discovery_service = None
+        self._api_loop = None
+        self._discovery_lock = threading.Lock()
         self.mobile_api_enabled = False
         self._shutdown_callback = shutdown_callback
         self.status = "stopped"
@@ -192,22 +194,20 @@ class ServerController:
             try:
                 time.sleep(15)
 
-                # 1. Health Check: Discovery Beacon Thread
-                if self.mobile_api_enabled and self.discovery_service:
-                    if not (
-                        self.discovery_service._thread
-                        and self.discovery_service._thread.is_alive()
-                    ):
-                        log.warning(
-                            _(
-                                "Watchdog: Discovery beacon thread died. Restarting discovery service..."
-                            )
+                # 1. Health Check: Discovery Beacon Task
+                if (
+                    self.mobile_api_enabled
+                    and self.discovery_service
+                    and self._api_loop
+                    and not self.discovery_service.is_alive()
+                ):
+                    log.warning(
+                        _(
+                            "Watchdog: Discovery beacon task died. Restarting discovery service..."
                         )
-                        hostname = socket.gethostname()
-                        self.discovery_service = DiscoveryService(
-                            self.get_port(), hostname
-                        )
-                        self.discovery_service.start()
+                    )
+                    self.discovery_service = None
+                    self._start_discovery()
 
                 # 2. Automated Non-Destructive Self-Healing Check
                 from ..services.repair_service import repair_service
@@ -258,20 +258,35 @@ class ServerController:
             except Exception as e:
                 log.debug(f"Watchdog loop iteration exception: {e}")
 
+    def attach_event_loop(self, loop):
+        """Called from the main API lifespan; discovery runs as a task on this loop."""
+        self._api_loop = loop
+        if self.mobile_api_enabled:
+            self._start_discovery()
+
+    def _start_discovery(self):
+        with self._discovery_lock:
+            if self._api_loop is None:
+                # Started from attach_event_loop once the API server is up
+                return
+            if not self.discovery_service:
+                hostname = socket.gethostname()
+                self.discovery_service = DiscoveryService(self.get_port(), hostname)
+            if not self.discovery_service.is_alive():
+                self.discovery_service.start(self._api_loop)
+                log.info("Discovery service started.")
+
     def activate_secure_mode(self):
         log.info("Activating secure mode...")
         self.mobile_api_enabled = True
-        if not self.discovery_service:
-            hostname = socket.gethostname()
-            self.discovery_service = DiscoveryService(self.get_port(), hostname)
-            self.discovery_service.start()
-            log.info("Discovery service started.")
+        self._start_discovery()
         log.info("Mobile API is now enabled.")
 
     def stop_mobile_api(self):
         if self.discovery_service:
             self.discovery_service.stop()
             self.discovery_service = None
+        # The API server (and its loop) keeps running; only the beacon stops
         self.mobile_api_enabled = False
         connected_devices.clear()
         log.info("Mobile API has been stopped.")
@@ -300,6 +315,7 @@ class ServerController:
         self._watchdog_running = False
         if self.discovery_service:
             self.discovery_service.stop()
+        self._api_loop = None
         if self.main_api_server:
             self.main_api_server.should_exit = True
         if self.main_api_thread:
@@ -7,6 +7,7 @@ import datetime
 import gettext
 import importlib.resources
 import ipaddress
+import json
 import logging
 import os
 import re
@@ -14,16 +15,38 @@ import socket
 import subprocess
 import sys
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Union
 
 import psutil
 
 from . import constants
 
+try:
+    import orjson
+
+    ORJSON_INSTALLED = True
+except ImportError:
+    ORJSON_INSTALLED = False
+
 log = logging.getLogger(__name__)
 _ = gettext.gettext
 
 
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_INSTALLED:
+        # Match stdlib behaviour of stringifying int/float dict keys
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes, using orjson when available."""
+    if ORJSON_INSTALLED:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def resource_path(relative_path: Union[str, Path]) -> Path:
     """Resolve absolute path for application resources."""
     # Case 1: PyInstaller bundle
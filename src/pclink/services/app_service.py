@@ -7,11 +7,18 @@ import configparser
 import logging
 import os
 import re
+import secrets
+import shlex
 import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from ..core import constants
+from ..core.utils import json_dumps_bytes, json_loads
 
 log = logging.getLogger(__name__)
 
@@ -20,27 +27,129 @@ class AppService:
     """Logic for application discovery, icon resolution, and launching."""
 
     def __init__(self):
-        self._cache = {"apps": [], "timestamp": 0}
+        self._cache = {"apps": [], "timestamp": 0, "sources_mtime": 0}
         self._cache_ttl = 86400  # 24 hours
+        # In-flight rescan shared by concurrent callers (single-flight)
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_forced = False
+        # (apps list, its JSON encoding); invalidated by list identity
+        self._cache_json: Optional[Tuple[List[Dict], bytes]] = None
+
+    def _is_cache_fresh(self) -> bool:
+        return bool(self._cache["apps"]) and (
+            time.time() - self._cache["timestamp"] < self._cache_ttl
+        )
 
     async def get_applications(self, force_refresh: bool = False) -> List[Dict]:
-        now = time.time()
-        if (
-            not force_refresh
-            and self._cache["apps"]
-            and (now - self._cache["timestamp"] < self._cache_ttl)
-        ):
+        if not force_refresh and self._is_cache_fresh():
             return self._cache["apps"]
 
+        # Join the running rescan unless a forced one is needed and it isn't
+        task = self._refresh_task
+        if task is None or task.done() or (force_refresh and not self._refresh_forced):
+            task = asyncio.create_task(self._refresh(force_refresh))
+            self._refresh_task = task
+            self._refresh_forced = force_refresh
+
+        # Shielded so one caller disconnecting doesn't cancel the shared scan
+        return await asyncio.shield(task)
+
+    async def get_applications_json(self, force_refresh: bool = False) -> bytes:
+        """Application list pre-serialized as JSON, re-encoded only when it changes."""
+        apps = await self.get_applications(force_refresh)
+        if self._cache_json is None or self._cache_json[0] is not apps:
+            self._cache_json = (apps, json_dumps_bytes(apps))
+        return self._cache_json[1]
+
+    async def _refresh(self, force_refresh: bool) -> List[Dict]:
+        now = time.time()
+        sources_mtime = await asyncio.to_thread(self._get_sources_mtime)
+
+        if not force_refresh:
+            cached = await asyncio.to_thread(self._load_disk_cache, sources_mtime, now)
+            if cached is not None:
+                self._cache = cached
+                return cached["apps"]
+
         apps = []
         if sys.platform == "win32":
             apps = await asyncio.to_thread(self._discover_win32)
         elif sys.platform.startswith("linux"):
             apps = await self._discover_linux_async()
 
-        self._cache = {"apps": apps, "timestamp": now}
+        self._cache = {
+            "apps": apps,
+            "timestamp": now,
+            "sources_mtime": sources_mtime,
+        }
+        # An empty scan never counts as fresh, so persisting it would just
+        # rewrite the file on every request
+        if apps:
+            await asyncio.to_thread(self._save_disk_cache, self._cache)
         return apps
 
+    def _get_source_dirs(self) -> List[Path]:
+        """Directories whose contents determine the discovered application list."""
+        if sys.platform == "win32":
+            start_menu = Path("Microsoft") / "Windows" / "Start Menu" / "Programs"
+            return [
+                Path(os.environ.get("PROGRAMDATA", r"C:\ProgramData")) / start_menu,
+                Path(os.environ.get("APPDATA", "")) / start_menu,
+            ]
+        if sys.platform.startswith("linux"):
+            return [
+                Path("/usr/share/applications"),
+                Path.home() / ".local/share/applications",
+            ]
+        return []
+
+    def _get_sources_mtime(self) -> int:
+        """Newest directory mtime across the source trees (adds/removes bump it)."""
+        newest = 0
+        stack = [str(p) for p in self._get_source_dirs()]
+        while stack:
+            current = stack.pop()
+            try:
+                newest = max(newest, os.stat(current).st_mtime_ns)
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
+                continue
+        return newest
+
+    def _load_disk_cache(self, sources_mtime: int, now: float) -> Optional[Dict]:
+        """Return the persisted scan if the source trees are unchanged and fresh."""
+        try:
+            data = json_loads(constants.APP_CACHE_FILE.read_bytes())
+            if (
+                data.get("sources_mtime") == sources_mtime
+                and data.get("apps")
+                and now - data.get("timestamp", 0) < self._cache_ttl
+            ):
+                return data
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _save_disk_cache(self, cache: Dict):
+        """Persist the scan result atomically so the next start can reuse it."""
+        # Unique per writer: a forced rescan can overlap an unforced one
+        tmp_path = constants.APP_CACHE_FILE.with_name(
+            f"{constants.APP_CACHE_FILE.name}.{secrets.token_hex(4)}.tmp"
+        )
+        try:
+            constants.APP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(json_dumps_bytes(cache))
+            os.replace(tmp_path, constants.APP_CACHE_FILE)
+        except OSError as e:
+            log.debug(f"Failed to persist application cache: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
     def _discover_win32(self) -> List[Dict]:
         apps = {}
         try:
@@ -54,28 +163,52 @@ class AppService:
             for p in paths:
                 if not p.exists():
                     continue
-                for lnk in p.glob("**/*.lnk"):
-                    try:
-                        shortcut = shell.CreateShortcut(str(lnk))
-                        target = shortcut.TargetPath
+                for root, _dirs, files in os.walk(p):
+                    for fn in files:
+                        suffix = fn[-4:].lower()
+                        if suffix not in (".lnk", ".url"):
+                            continue
+                        name = fn[:-4]
+                        if name in apps:
+                            continue
+
+                        full_path = os.path.join(root, fn)
+                        try:
+                            if suffix == ".lnk":
+                                target = shell.CreateShortcut(full_path).TargetPath
+                            else:
+                                target = self._resolve_url_shortcut(full_path)
+                        except Exception:
+                            continue
+
                         if (
                             target
                             and target.lower().endswith(".exe")
                             and os.path.exists(target)
                         ):
-                            if lnk.stem not in apps:
-                                apps[lnk.stem] = {
-                                    "name": lnk.stem,
-                                    "command": target,
-                                    "icon_path": target,
-                                    "is_custom": False,
-                                }
-                    except Exception:
-                        continue
+                            apps[name] = {
+                                "name": name,
+                                "command": target,
+                                "icon_path": target,
+                                "is_custom": False,
+                            }
         except Exception as e:
             log.debug(f"Win32 shortcut discovery failed: {e}")
 
-        return sorted(list(apps.values()), key=lambda x: x["name"])
+        return [apps[name] for name in sorted(apps)]
+
+    @staticmethod
+    def _resolve_url_shortcut(url_file: str) -> Optional[str]:
+        """Extracts a local file target from an Internet Shortcut (.url) file."""
+        cfg = configparser.ConfigParser(interpolation=None)
+        try:
+            cfg.read(url_file, encoding="utf-8")
+            url = cfg.get("InternetShortcut", "URL", fallback="")
+        except (configparser.Error, UnicodeDecodeError):
+            return None
+        if url.lower().startswith("file:"):
+            return url2pathname(urlparse(url).path)
+        return None
 
     def _parse_desktop_file(self, desktop_file: Path) -> Optional[Dict]:
         """Parses a single .desktop file and resolves its application icon."""
@@ -105,20 +238,19 @@ class AppService:
             pass
         return None
 
-    async def _discover_linux_async(self) -> List[Dict]:
-        """Parses .desktop files and resolves icons in parallel worker threads."""
-        paths = [
-            Path("/usr/share/applications"),
-            Path.home() / ".local/share/applications",
-        ]
+    def _collect_desktop_files(self) -> List[Path]:
         desktop_files = []
-        for p in paths:
+        for p in self._get_source_dirs():
             if p.is_dir():
                 try:
-                    desktop_files.extend(list(p.glob("**/*.desktop")))
+                    desktop_files.extend(p.glob("**/*.desktop"))
                 except Exception:
                     pass
+        return desktop_files
 
+    async def _discover_linux_async(self) -> List[Dict]:
+        """Parses .desktop files and resolves icons in parallel worker threads."""
+        desktop_files = await asyncio.to_thread(self._collect_desktop_files)
         if not desktop_files:
             return []
 
@@ -134,7 +266,7 @@ class AppService:
                 if name not in apps:
                     apps[name] = res
 
-        return sorted(list(apps.values()), key=lambda x: x["name"])
+        return [apps[name] for name in sorted(apps)]
 
     def find_linux_icon(self, name: str) -> Optional[str]:
         if not name:
@@ -186,23 +318,30 @@ class AppService:
         return None
 
     async def launch(self, command: str):
+        """Starts an application directly, without an intermediate shell process."""
+        if sys.platform == "win32":
+            # CreateProcess takes a command line; unquoted commands are an exe path
+            args = command if command.startswith('"') else [command]
+        else:
+            args = shlex.split(command)
+            if not args:
+                raise ValueError("Empty command")
+
         def _run():
-            flags = 0
             kwargs = {
-                "shell": True,
                 "stdout": subprocess.DEVNULL,
                 "stderr": subprocess.DEVNULL,
                 "stdin": subprocess.DEVNULL,
+                "close_fds": True,
             }
             if sys.platform == "win32":
-                flags = subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS
-                kwargs["creationflags"] = flags
-                command_run = command if command.startswith('"') else f'"{command}"'
+                kwargs["creationflags"] = (
+                    subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS
+                )
             else:
                 kwargs["start_new_session"] = True
-                command_run = command
 
-            subprocess.Popen(command_run, **kwargs)
+            subprocess.Popen(args, **kwargs)
 
         await asyncio.to_thread(_run)
 
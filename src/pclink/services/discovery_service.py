@@ -1,16 +1,17 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # Copyright (C) 2025 AZHAR ZOUHIR / BYTEDz
 
+import asyncio
+import concurrent.futures
 import gettext
-import json
 import logging
 import platform
 import socket
-import threading
-import time
+import struct
 import uuid
 
 from ..core.logging import log_telemetry_event
+from ..core.utils import get_available_ips, json_dumps_bytes
 
 log = logging.getLogger(__name__)
 _ = gettext.gettext
@@ -23,6 +24,16 @@ BEACON_MAGIC = "PCLINK_DISCOVERY_BEACON_V1"
 class DiscoveryService:
     """Interface for LAN discovery beacons with automated socket auto-rebind."""
 
+    __slots__ = (
+        "api_port",
+        "hostname",
+        "server_id",
+        "_task",
+        "_socket",
+        "_beacon_payload",
+        "_dests",
+    )
+
     def __init__(self, api_port: int, hostname: str, server_id: str = None):
         """
         Setup discovery state.
@@ -35,9 +46,10 @@ class DiscoveryService:
         self.api_port = api_port
         self.hostname = hostname
         self.server_id = server_id or self.generate_server_id()
-        self._thread: threading.Thread | None = None
-        self._running = False
+        self._task: concurrent.futures.Future | None = None
         self._socket: socket.socket | None = None
+        self._beacon_payload: bytes = self._get_beacon_payload()
+        self._dests: list[tuple[str, int]] = []
 
     @staticmethod
     def generate_server_id() -> str:
@@ -46,14 +58,12 @@ class DiscoveryService:
         return str(uuid.uuid5(uuid.NAMESPACE_DNS, system_info))
 
     def _get_beacon_payload(self) -> bytes:
-        """Prepare JSON beacon payload."""
+        """Prepare JSON beacon payload (serialized once, at init)."""
         try:
             from ..core.version import __version__ as _ver
         except Exception:
             _ver = "unknown"
 
-        from ..core.utils import get_available_ips
-
         payload = {
             "magic": BEACON_MAGIC,
             "port": self.api_port,
@@ -64,7 +74,7 @@ class DiscoveryService:
             "version": _ver,
             "ips": get_available_ips(),
         }
-        return json.dumps(payload).encode("utf-8")
+        return json_dumps_bytes(payload)
 
     def _init_socket(self) -> bool:
         """Initialize or re-bind UDP broadcast socket safely."""
@@ -103,64 +113,64 @@ class DiscoveryService:
             )
             return False
 
-    def _broadcast_loop(self):
+    async def _broadcast_loop(self):
         """Continuous UDP broadcast loop with automatic socket recreation on network drop."""
         if not self._init_socket():
             return
 
-        beacon_payload = self._get_beacon_payload()
-        broadcast_addresses = self._get_broadcast_addresses()
+        payload = self._beacon_payload
+        self._dests = await asyncio.to_thread(self._get_destinations)
 
         log.info(_("Discovery service starting on port {}").format(DISCOVERY_PORT))
 
-        # Send an immediate first beacon
-        for broadcast_addr in broadcast_addresses:
-            try:
-                self._socket.sendto(beacon_payload, (broadcast_addr, DISCOVERY_PORT))
-            except Exception:
-                pass
+        try:
+            # Send an immediate first beacon
+            send = self._socket.sendto
+            for dest in self._dests:
+                try:
+                    send(payload, dest)
+                except Exception:
+                    pass
 
-        iteration = 0
-        while self._running:
-            try:
-                # Refresh broadcast addresses every 60 seconds
-                if iteration % 12 == 0 and iteration > 0:
-                    broadcast_addresses = self._get_broadcast_addresses()
-                iteration += 1
-
-                for broadcast_addr in broadcast_addresses:
-                    try:
-                        self._socket.sendto(
-                            beacon_payload, (broadcast_addr, DISCOVERY_PORT)
-                        )
-                    except OSError as e:
-                        if (
-                            getattr(e, "winerror", None) == 10051
-                            or getattr(e, "errno", None) == 101
-                        ):
-                            log.debug(f"Skipping unreachable network: {broadcast_addr}")
-                        else:
-                            log.warning(
-                                _("Broadcast write error on {}: {}").format(
-                                    broadcast_addr, e
+            iteration = 0
+            while True:
+                await asyncio.sleep(5)
+                try:
+                    # Refresh broadcast addresses every 60 seconds
+                    iteration += 1
+                    if iteration % 12 == 0:
+                        self._dests = await asyncio.to_thread(self._get_destinations)
+
+                    send = self._socket.sendto
+                    for dest in self._dests:
+                        try:
+                            send(payload, dest)
+                        except OSError as e:
+                            if (
+                                getattr(e, "winerror", None) == 10051
+                                or getattr(e, "errno", None) == 101
+                            ):
+                                log.debug(f"Skipping unreachable network: {dest[0]}")
+                            else:
+                                log.warning(
+                                    _("Broadcast write error on {}: {}").format(
+                                        dest[0], e
+                                    )
                                 )
-                            )
-                            # Re-bind socket on severe socket errors
-                            self._init_socket()
-                            break
-
-            except Exception as e:
-                log.error(_("Discovery broadcast exception: {}").format(e))
-                self._init_socket()
-
-            time.sleep(5)
-
-        log.info(_("Discovery broadcast stopped."))
-        if self._socket:
-            try:
-                self._socket.close()
-            except Exception:
-                pass
+                                # Re-bind socket on severe socket errors
+                                self._init_socket()
+                                break
+
+                except Exception as e:
+                    log.error(_("Discovery broadcast exception: {}").format(e))
+                    self._init_socket()
+        finally:
+            log.info(_("Discovery broadcast stopped."))
+            if self._socket:
+                try:
+                    self._socket.close()
+                except Exception:
+                    pass
 
     def _smart_bind_socket(self):
         """Bind with fallback (Linux compatibility)."""
@@ -181,13 +191,35 @@ class DiscoveryService:
             _("Could not bind UDP socket explicitly, operating in unbound state.")
         )
 
+    def _get_destinations(self) -> list[tuple[str, int]]:
+        """Prebuild (address, port) send targets so the loop reuses the tuples."""
+        return [(addr, DISCOVERY_PORT) for addr in self._get_broadcast_addresses()]
+
+    @staticmethod
+    def _directed_broadcast(address: str, netmask: str) -> str | None:
+        """Compute the subnet's directed broadcast address (ip | ~netmask)."""
+        if not address or not netmask:
+            return None
+        try:
+            ip = struct.unpack("!I", socket.inet_aton(address))[0]
+            mask = struct.unpack("!I", socket.inet_aton(netmask))[0]
+        except OSError:
+            return None
+        return socket.inet_ntoa(struct.pack("!I", ip | (~mask & 0xFFFFFFFF)))
+
     def _get_broadcast_addresses(self):
         """Resolve multiple broadcast targets across active network adapters."""
-        broadcast_addresses = ["<broadcast>", "255.255.255.255"]
+        # Literal limited broadcast; "<broadcast>" maps to the same address.
+        broadcast_addresses = ["255.255.255.255"]
 
         try:
             import psutil
 
+            try:
+                if_stats = psutil.net_if_stats()
+            except Exception:
+                if_stats = None
+
             for interface_name, interface_addrs in psutil.net_if_addrs().items():
                 if (
                     interface_name.startswith(("lo", "docker", "br-", "veth", "virbr"))
@@ -195,35 +227,19 @@ class DiscoveryService:
                 ):
                     continue
 
-                try:
-                    if_stats = psutil.net_if_stats().get(interface_name)
-                    if not if_stats or not if_stats.isup:
+                if if_stats is not None:
+                    stats = if_stats.get(interface_name)
+                    if not stats or not stats.isup:
                         continue
-                except (AttributeError, KeyError):
-                    pass
 
                 for addr in interface_addrs:
-                    if addr.family == socket.AF_INET:
-                        if hasattr(addr, "broadcast") and addr.broadcast:
-                            target_broadcast = addr.broadcast
-                        elif addr.address and addr.netmask:
-                            try:
-                                import ipaddress
-
-                                network = ipaddress.IPv4Network(
-                                    f"{addr.address}/{addr.netmask}", strict=False
-                                )
-                                target_broadcast = str(network.broadcast_address)
-                            except Exception:
-                                continue
-                        else:
-                            continue
-
-                        if (
-                            target_broadcast
-                            and target_broadcast not in broadcast_addresses
-                        ):
-                            broadcast_addresses.append(target_broadcast)
+                    if addr.family != socket.AF_INET:
+                        continue
+                    target_broadcast = addr.broadcast or self._directed_broadcast(
+                        addr.address, addr.netmask
+                    )
+                    if target_broadcast and target_broadcast not in broadcast_addresses:
+                        broadcast_addresses.append(target_broadcast)
 
         except ImportError:
             try:
@@ -251,18 +267,18 @@ class DiscoveryService:
 
         return broadcast_addresses
 
-    def start(self):
-        """Launch background beacon thread."""
-        if self._running:
+    def start(self, loop: asyncio.AbstractEventLoop):
+        """Schedule the beacon task on the API server's event loop (thread-safe)."""
+        if self.is_alive():
             return
-        self._running = True
-        self._thread = threading.Thread(
-            target=self._broadcast_loop, daemon=True, name="pclink-discovery"
-        )
-        self._thread.start()
+        self._task = asyncio.run_coroutine_threadsafe(self._broadcast_loop(), loop)
+
+    def is_alive(self) -> bool:
+        """Whether the beacon task is scheduled or running."""
+        return self._task is not None and not self._task.done()
 
     def stop(self):
         """Tear down beacon service."""
-        self._running = False
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=1.0)
+        if self._task:
+            self._task.cancel()
+            self._task = None
@@ -9,12 +9,18 @@ import mimetypes
 import os
 import platform
 import shutil
+import subprocess
 import sys
 import tempfile
+import threading
 import time
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 from typing import Any, Dict, Generator, List, Optional
 
 from ..core.validators import validate_filename
@@ -38,9 +44,217 @@ except ImportError:
     AV_INSTALLED = False
 
 # Constants
+IS_WINDOWS = platform.system() == "Windows"
 HOME_DIR = Path.home().resolve()
 THUMBNAIL_CACHE_DIR = Path(tempfile.gettempdir()) / "pclink_thumbnails"
 THUMBNAIL_CACHE_DIR.mkdir(exist_ok=True, parents=True)
+EXTRACT_BUFFER_SIZE = 1024 * 1024  # zipfile.extract uses 64 KiB off Windows
+STREAM_CHUNK_SIZE = 1024 * 1024  # per-read size for ranged file streaming
+EXTRACT_WORKERS = min(4, os.cpu_count() or 1)
+COPY_WORKERS = min(8, (os.cpu_count() or 1) * 2)  # file copies are I/O-bound
+THUMBNAIL_MEMORY_CACHE_SIZE = 512  # ~256x256 PNGs, a few MB at most
+# Large listings stat entries in parallel; on network mounts each stat is a
+# round-trip. Windows gets stat data from FindNextFile, so it stays serial.
+STAT_PARALLEL_THRESHOLD = 64
+# In-flight items per delete/move/copy batch. They run on their own pool so a
+# bulk paste or delete can't starve uploads and other to_thread users.
+FILE_OP_CONCURRENCY = 8
+_stat_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="pclink-stat")
+_file_op_pool = ThreadPoolExecutor(
+    max_workers=FILE_OP_CONCURRENCY, thread_name_prefix="pclink-fileop"
+)
+# Shared by every directory copy, so concurrent pastes don't each add a pool
+_copy_pool = ThreadPoolExecutor(
+    max_workers=COPY_WORKERS, thread_name_prefix="pclink-copy"
+)
+
+# Already-compressed formats; deflating them again burns CPU for ~0% gain
+STORED_EXTENSIONS = frozenset(
+    (
+        ".zip",
+        ".7z",
+        ".rar",
+        ".gz",
+        ".bz2",
+        ".xz",
+        ".zst",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".webp",
+        ".mp4",
+        ".mkv",
+        ".avi",
+        ".mov",
+        ".webm",
+        ".mp3",
+        ".m4a",
+        ".aac",
+        ".ogg",
+        ".flac",
+    )
+)
+
+
+@lru_cache(maxsize=1024)
+def _item_type_for_suffix(ext: str) -> str:
+    """Maps a lowercased file extension to a browser item type."""
+    mime, _ = mimetypes.guess_type("x" + ext)
+    if mime:
+        if mime.startswith("video/"):
+            return "video"
+        if mime.startswith("image/"):
+            return "image"
+        if mime.startswith("audio/"):
+            return "audio"
+        if mime in (
+            "application/zip",
+            "application/x-zip-compressed",
+            "application/x-tar",
+            "application/x-gzip",
+            "application/x-bzip2",
+            "application/x-7z-compressed",
+            "application/x-rar-compressed",
+        ):
+            return "archive"
+
+    if ext in (".mp4", ".mkv", ".avi", ".webm", ".mov", ".flv", ".wmv", ".m4v"):
+        return "video"
+    if ext in (
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".webp",
+        ".bmp",
+        ".tiff",
+        ".svg",
+        ".ico",
+    ):
+        return "image"
+    if ext in (".mp3", ".wav", ".ogg", ".flac", ".m4a", ".aac", ".wma"):
+        return "audio"
+    if ext in (".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz"):
+        return "archive"
+
+    return "file"
+
+
+async def _run_file_op(func, *args):
+    """asyncio.to_thread, but on the dedicated delete/move/copy pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_file_op_pool, func, *args)
+
+
+def _stat_entry(entry: os.DirEntry) -> Optional[os.stat_result]:
+    """Symlink-following stat of a scandir entry, or None if it can't be read."""
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+
+# Linux FICLONE ioctl: copy-on-write clone on btrfs/xfs (and other reflink-capable
+# filesystems); fails with EOPNOTSUPP/EXDEV elsewhere and falls back to copy2
+FICLONE = 0x40049409
+if sys.platform.startswith("linux"):
+    import fcntl
+else:
+    fcntl = None
+
+
+def _copy_file(src: str, dst: str) -> str:
+    """shutil.copy2 that first tries an instant reflink clone where available."""
+    # Only regular files can be cloned; opening a FIFO would block forever,
+    # and copy2 raises SpecialFileError for those itself
+    if fcntl is not None and S_ISREG(os.stat(src).st_mode):
+        try:
+            # "xb": never truncate an existing file (dst could be src itself)
+            with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+                try:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                    cloned = True
+                except OSError:
+                    cloned = False
+            if cloned:
+                shutil.copystat(src, dst)
+                return dst
+            os.unlink(dst)
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _parallel_copytree(src: str, dst: str) -> str:
+    """shutil.copytree (symlinks followed) with file copies spread over threads.
+
+    Directories are created up front in one walk, files are copied on the
+    shared copy pool, and directory metadata is applied last so file creation
+    can't bump it.
+    """
+    dirs = []
+    errors = []
+    futures = {}
+    stack = [(src, dst)]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        try:
+            os.makedirs(dst_dir)
+            dirs.append((src_dir, dst_dir))
+            with os.scandir(src_dir) as it:
+                entries = list(it)
+        except OSError as e:
+            if src_dir == src:
+                raise
+            errors.append((src_dir, dst_dir, str(e)))
+            continue
+
+        for entry in entries:
+            target = os.path.join(dst_dir, entry.name)
+            try:
+                is_dir = entry.is_dir()
+            except OSError as e:
+                errors.append((entry.path, target, str(e)))
+                continue
+            if is_dir:
+                stack.append((entry.path, target))
+            else:
+                futures[_copy_pool.submit(_copy_file, entry.path, target)] = (
+                    entry.path,
+                    target,
+                )
+
+    for future in as_completed(futures):
+        try:
+            future.result()
+        except OSError as e:
+            errors.append((*futures[future], str(e)))
+
+    for src_dir, dst_dir in reversed(dirs):
+        try:
+            shutil.copystat(src_dir, dst_dir)
+        except OSError as e:
+            errors.append((src_dir, dst_dir, str(e)))
+    if errors:
+        raise shutil.Error(errors)
+    return dst
+
+
+# Launcher resolved once; only the argument changes between calls
+_OPEN_COMMAND = "open" if sys.platform == "darwin" else "xdg-open"
+
+
+def _open_with_default_app(path: Path):
+    if IS_WINDOWS:
+        os.startfile(path)
+        return
+    subprocess.Popen(
+        [_OPEN_COMMAND, str(path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
 
 
 class FileService:
@@ -49,7 +263,12 @@ class FileService:
     def __init__(self):
         self._roots_cache = None
         self._roots_cache_time = 0.0
+        self._safe_root_prefixes = ()
+        self._root_strs = frozenset()
         self._metadata_cache = {}  # (str_path, mtime, size) -> dict / duration
+        # Recently served thumbnails (cache key -> PNG bytes), LRU-bounded
+        self._thumb_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._thumb_cache_lock = threading.Lock()
 
     async def get_file_hash(self, path: str) -> str:
         """Fast hashing utilizing native C-implementation in modern Python."""
@@ -67,48 +286,67 @@ class FileService:
 
     def get_system_roots(self) -> List[Path]:
         """Get available system roots (drives on Windows, / on Unix) with a short TTL cache."""
-        now = time.time()
+        # The Unix root never changes; only Windows drives can come and go
+        if not IS_WINDOWS:
+            if self._roots_cache is None:
+                self._set_roots([Path("/")])
+            return self._roots_cache
+
+        now = time.monotonic()
         if self._roots_cache and (now - self._roots_cache_time < 5.0):
             return self._roots_cache
 
-        if platform.system() == "Windows":
-            roots = []
-            try:
-                import string
-                from ctypes import windll
+        roots = []
+        try:
+            import string
+            from ctypes import windll
 
-                drives_bitmask = windll.kernel32.GetLogicalDrives()
-                for i, letter in enumerate(string.ascii_uppercase):
-                    if drives_bitmask & (1 << i):
-                        roots.append(Path(f"{letter}:\\"))
-            except Exception:
-                for d in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-                    p = Path(f"{d}:\\")
-                    if p.exists():
-                        roots.append(p)
-            self._roots_cache = roots
-            self._roots_cache_time = now
-            return roots
-
-        roots = [Path("/")]
+            drives_bitmask = windll.kernel32.GetLogicalDrives()
+            for i, letter in enumerate(string.ascii_uppercase):
+                if drives_bitmask & (1 << i):
+                    roots.append(Path(f"{letter}:\\"))
+        except Exception:
+            for d in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+                p = Path(f"{d}:\\")
+                if p.exists():
+                    roots.append(p)
+        self._set_roots(roots, now)
+        return roots
+
+    def _set_roots(self, roots: List[Path], now: float = 0.0):
         self._roots_cache = roots
         self._roots_cache_time = now
-        return roots
+        # Normcased, separator-terminated prefixes for is_path_safe, built once
+        # per refresh instead of on every path check
+        prefixes = []
+        for root in (*roots, HOME_DIR):
+            root_str = os.path.normcase(str(root))
+            if not root_str.endswith(os.sep):
+                root_str += os.sep
+            prefixes.append(root_str)
+        self._safe_root_prefixes = tuple(prefixes)
+        self._root_strs = frozenset(str(root) for root in roots)
+
+    def is_system_root(self, path: Path) -> bool:
+        """Whether a path is one of the system roots (a drive, or / on Unix)."""
+        self.get_system_roots()
+        return str(path) in self._root_strs
 
     def is_path_safe(self, path: Path) -> bool:
         """Checks if a path is within allowed system roots or home."""
-        safe_roots = self.get_system_roots() + [HOME_DIR]
         try:
             resolved = path.resolve()
         except Exception:
             resolved = path.absolute()
 
-        for root in safe_roots:
-            try:
-                resolved.relative_to(root)
+        return self._is_resolved_path_safe(resolved)
+
+    def _is_resolved_path_safe(self, resolved: Path) -> bool:
+        self.get_system_roots()
+        resolved_str = os.path.normcase(str(resolved))
+        for prefix in self._safe_root_prefixes:
+            if resolved_str.startswith(prefix) or resolved_str + os.sep == prefix:
                 return True
-            except ValueError:
-                continue
         return False
 
     def validate_path(self, user_path: str, check_existence: bool = True) -> Path:
@@ -124,12 +362,19 @@ class FileService:
         if not path.is_absolute():
             path = HOME_DIR / path
 
-        resolved = path.resolve(strict=False)
-
-        if check_existence and not resolved.exists():
-            raise FileNotFoundError(_("Path not found: {}").format(user_path))
+        if check_existence:
+            # strict resolve doubles as the existence check (no extra stat)
+            try:
+                resolved = path.resolve(strict=True)
+            except PermissionError:
+                raise
+            except OSError:
+                raise FileNotFoundError(_("Path not found: {}").format(user_path))
+        else:
+            resolved = path.resolve(strict=False)
 
-        if not self.is_path_safe(resolved):
+        # Already resolved above; skip is_path_safe's second resolve()
+        if not self._is_resolved_path_safe(resolved):
             raise PermissionError(_("Access to path denied: {}").format(user_path))
 
         return resolved
@@ -138,46 +383,8 @@ class FileService:
         if is_dir:
             return "folder"
 
-        mime, _ = mimetypes.guess_type(name)
-        if mime:
-            if mime.startswith("video/"):
-                return "video"
-            if mime.startswith("image/"):
-                return "image"
-            if mime.startswith("audio/"):
-                return "audio"
-            if mime in (
-                "application/zip",
-                "application/x-zip-compressed",
-                "application/x-tar",
-                "application/x-gzip",
-                "application/x-bzip2",
-                "application/x-7z-compressed",
-                "application/x-rar-compressed",
-            ):
-                return "archive"
-
-        ext = Path(name).suffix.lower()
-        if ext in (".mp4", ".mkv", ".avi", ".webm", ".mov", ".flv", ".wmv", ".m4v"):
-            return "video"
-        if ext in (
-            ".jpg",
-            ".jpeg",
-            ".png",
-            ".gif",
-            ".webp",
-            ".bmp",
-            ".tiff",
-            ".svg",
-            ".ico",
-        ):
-            return "image"
-        if ext in (".mp3", ".wav", ".ogg", ".flac", ".m4a", ".aac", ".wma"):
-            return "audio"
-        if ext in (".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz"):
-            return "archive"
-
-        return "file"
+        # Type depends only on the extension; a listing has few distinct ones
+        return _item_type_for_suffix(os.path.splitext(name)[1].lower())
 
     def _probe_media_duration_sync(self, file_path: Path, cache_key: tuple) -> int:
         """Helper to probe media container duration synchronously."""
@@ -207,17 +414,26 @@ class FileService:
             if not os.access(path, os.R_OK):
                 raise PermissionError(_("Read access denied: {}").format(path))
 
+            with os.scandir(path) as it:
+                entries = list(it)
+
+            if IS_WINDOWS or len(entries) < STAT_PARALLEL_THRESHOLD:
+                stats = map(_stat_entry, entries)
+            else:
+                stats = _stat_pool.map(_stat_entry, entries)
+
             scanned = []
-            for entry in os.scandir(path):
-                try:
-                    stat = entry.stat()
-                    is_dir = entry.is_dir()
-                    item_type = self.get_item_type(entry.name, is_dir)
-                    scanned.append(
-                        (entry.name, is_dir, item_type, stat.st_size, stat.st_mtime)
-                    )
-                except Exception:
+            for entry, st in zip(entries, stats):
+                if st is None:
                     continue
+                # Derived from the same (symlink-following) stat; entry.is_dir()
+                # would stat symlinks a second time
+                is_dir = S_ISDIR(st.st_mode)
+                item_type = self.get_item_type(entry.name, is_dir)
+                scanned.append((entry.name, is_dir, item_type, st.st_size, st.st_mtime))
+            # Folders first, then case-insensitive name; sorted here so it runs
+            # in the worker thread rather than on the event loop
+            scanned.sort(key=lambda e: (not e[1], e[0].lower()))
             return scanned
 
         scanned_entries = await asyncio.to_thread(_scan_entries)
@@ -261,24 +477,47 @@ class FileService:
                 }
             )
 
-        items.sort(key=lambda x: (not x["is_dir"], x["name"].lower()))
         return items
 
+    def _thumb_cache_get(self, key: str) -> Optional[bytes]:
+        with self._thumb_cache_lock:
+            data = self._thumb_cache.get(key)
+            if data is not None:
+                self._thumb_cache.move_to_end(key)
+            return data
+
+    def _thumb_cache_put(self, key: str, data: bytes):
+        with self._thumb_cache_lock:
+            self._thumb_cache[key] = data
+            self._thumb_cache.move_to_end(key)
+            while len(self._thumb_cache) > THUMBNAIL_MEMORY_CACHE_SIZE:
+                self._thumb_cache.popitem(last=False)
+
     async def get_thumbnail(self, file_path: Path) -> Optional[bytes]:
         """Generates or retrieves a cached thumbnail for an image or a video."""
-        if not PIL_INSTALLED or not file_path.is_file():
+        if not PIL_INSTALLED:
             return None
 
         def _get_thumb():
             try:
                 stat = file_path.stat()
+                if not S_ISREG(stat.st_mode):
+                    return None
+                # file_path comes from validate_path, so it is already resolved
                 key = hashlib.sha1(
-                    f"{file_path.resolve()}:{stat.st_mtime}:{stat.st_size}".encode()
+                    f"{file_path}:{stat.st_mtime}:{stat.st_size}".encode()
                 ).hexdigest()
                 cache_file = THUMBNAIL_CACHE_DIR / f"{key}.png"
 
-                if cache_file.exists():
-                    return cache_file.read_bytes()
+                data = self._thumb_cache_get(key)
+                if data is not None:
+                    return data
+                try:
+                    data = cache_file.read_bytes()
+                    self._thumb_cache_put(key, data)
+                    return data
+                except FileNotFoundError:
+                    pass
 
                 mime, _ = mimetypes.guess_type(file_path.name)
                 ext = file_path.suffix.lower()
@@ -292,6 +531,11 @@ class FileService:
                     ".bmp",
                 ):
                     with Image.open(file_path) as img:
+                        # JPEG: let libjpeg decode at 1/2..1/8 scale instead of
+                        # full size (no-op for other formats). 2x the target, as
+                        # thumbnail()'s own reducing_gap does, keeps it sharp.
+                        img.draft(img.mode, (512, 512))
+
                         # Convert palette and transparency images to RGBA to avoid Pillow UserWarnings
                         if (
                             img.mode in ("P", "PA", "1", "L")
@@ -309,6 +553,7 @@ class FileService:
 
                         data = buf.getvalue()
                         cache_file.write_bytes(data)
+                        self._thumb_cache_put(key, data)
                         return data
                 elif (
                     (mime and mime.startswith("video/"))
@@ -351,6 +596,7 @@ class FileService:
                             img.convert("RGB").save(buf, format="PNG")
                             data = buf.getvalue()
                             cache_file.write_bytes(data)
+                            self._thumb_cache_put(key, data)
                             return data
             except Exception as e:
                 log.error(f"Failed to generate thumbnail for {file_path}: {e}")
@@ -576,19 +822,35 @@ class FileService:
             files = []
             total = 0
             for p in resolved:
-                if p.is_file():
-                    total += p.stat().st_size
-                    files.append((p, p.name, p.stat().st_size))
-                elif p.is_dir():
-                    for root, _, fs in os.walk(p):
-                        for f in fs:
-                            fp = Path(root) / f
-                            try:
-                                size = fp.stat().st_size
-                                total += size
-                                files.append((fp, fp.relative_to(p.parent), size))
-                            except Exception:
-                                continue
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                if S_ISREG(st.st_mode):
+                    total += st.st_size
+                    files.append((str(p), p.name, st.st_size))
+                elif S_ISDIR(st.st_mode):
+                    # scandir walk: one (cached on Windows) stat per file, and
+                    # like os.walk, symlinked directories are not descended
+                    stack = [(str(p), p.name)]
+                    while stack:
+                        dir_path, arc_dir = stack.pop()
+                        try:
+                            with os.scandir(dir_path) as it:
+                                for entry in it:
+                                    arcname = os.path.join(arc_dir, entry.name)
+                                    try:
+                                        if entry.is_dir():
+                                            if not entry.is_symlink():
+                                                stack.append((entry.path, arcname))
+                                            continue
+                                        size = entry.stat().st_size
+                                    except OSError:
+                                        continue
+                                    total += size
+                                    files.append((entry.path, arcname, size))
+                        except OSError:
+                            continue
 
             if not total:
                 with zipfile.ZipFile(out, "w") as zf:
@@ -597,15 +859,24 @@ class FileService:
                 return
 
             written = 0
+            last_pct = 0
             yield 0
             with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
                 for fp, arcname, size in files:
+                    compress_type = (
+                        zipfile.ZIP_STORED
+                        if os.path.splitext(fp)[1].lower() in STORED_EXTENSIONS
+                        else None
+                    )
                     try:
-                        zf.write(fp, arcname)
+                        zf.write(fp, arcname, compress_type=compress_type)
                     except Exception as e:
                         log.error(f"Failed to compress {fp}: {e}")
                     written += size
-                    yield int((written / total) * 100)
+                    pct = int((written / total) * 100)
+                    if pct != last_pct:
+                        last_pct = pct
+                        yield pct
 
         return _gen()
 
@@ -625,21 +896,74 @@ class FileService:
                     yield 100
                     return
 
-                ext = 0
-                yield 0
-                for m in info:
-                    if ".." in m.filename or os.path.isabs(m.filename):
-                        continue
+            # Validate up front; keyed by target so a name repeated in the
+            # archive is written once (last entry wins, as with serial extract)
+            members = {}
+            for m in info:
+                if ".." in m.filename or os.path.isabs(m.filename):
+                    continue
 
-                    target_path = Path(dest / m.filename).resolve()
-                    try:
-                        target_path.relative_to(resolved_dest)
-                    except ValueError:
-                        continue
+                name = m.filename
+                if IS_WINDOWS:
+                    # Same illegal-character and trailing-dot cleanup that
+                    # ZipFile.extract applies there
+                    name = zipfile.ZipFile._sanitize_windows_name(
+                        name.replace("/", os.sep), os.sep
+                    )
+                target_path = Path(dest / name).resolve()
+                try:
+                    target_path.relative_to(resolved_dest)
+                except ValueError:
+                    continue
+                members.pop(target_path, None)
+                members[target_path] = m
+
+            # ZipFile handles aren't safe to share across threads for reads
+            local = threading.local()
+            handles = []
+
+            def _extract_one(m, target_path):
+                handle = getattr(local, "zf", None)
+                if handle is None:
+                    handle = local.zf = zipfile.ZipFile(zip_path, "r")
+                    handles.append(handle)
+
+                # Not ZipFile.extract: its exists-then-makedirs check races
+                # when workers share a new parent directory
+                if m.is_dir():
+                    target_path.mkdir(parents=True, exist_ok=True)
+                else:
+                    target_path.parent.mkdir(parents=True, exist_ok=True)
+                    with handle.open(m, pwd=pwd) as src, open(target_path, "wb") as dst:
+                        shutil.copyfileobj(src, dst, EXTRACT_BUFFER_SIZE)
+                return m.file_size
 
-                    zf.extract(m, dest, pwd=pwd)
-                    ext += m.file_size
-                    yield int((ext / total) * 100)
+            ext = 0
+            last_pct = 0
+            yield 0
+            # zlib releases the GIL while inflating, so members decompress in
+            # parallel
+            pool = ThreadPoolExecutor(max_workers=EXTRACT_WORKERS)
+            finished = False
+            try:
+                futures = [pool.submit(_extract_one, m, t) for t, m in members.items()]
+                for fut in as_completed(futures):
+                    ext += fut.result()
+                    pct = int((ext / total) * 100)
+                    if pct != last_pct:
+                        last_pct = pct
+                        yield pct
+                finished = True
+            finally:
+                if finished:
+                    pool.shutdown()
+                    for handle in handles:
+                        handle.close()
+                else:
+                    # Error or client disconnect: drop queued members without
+                    # waiting on running ones; their thread-local handles are
+                    # released with the worker threads
+                    pool.shutdown(wait=False, cancel_futures=True)
 
         return _gen()
 
@@ -705,48 +1029,62 @@ class FileService:
     async def delete_items(
         self, paths: List[str], use_trash: bool = False
     ) -> List[Dict[str, Any]]:
-        results = []
+        limiter = asyncio.Semaphore(FILE_OP_CONCURRENCY)
 
         async def _do_delete(p_str: str) -> Dict[str, Any]:
+            async with limiter:
+                return await _delete_one(p_str)
+
+        async def _delete_one(p_str: str) -> Dict[str, Any]:
             try:
                 p = self.validate_path(p_str)
                 if use_trash:
                     try:
                         import send2trash
 
-                        await asyncio.to_thread(send2trash.send2trash, str(p))
+                        await _run_file_op(send2trash.send2trash, str(p))
                     except Exception:
-                        await asyncio.to_thread(self._trash_item_fallback, p)
+                        await _run_file_op(self._trash_item_fallback, p)
                 else:
                     if p.is_dir():
-                        await asyncio.to_thread(shutil.rmtree, p)
+                        await _run_file_op(shutil.rmtree, p)
                     else:
-                        await asyncio.to_thread(p.unlink)
+                        await _run_file_op(p.unlink)
                 return {"path": p_str, "success": True}
             except Exception as e:
                 return {"path": p_str, "success": False, "reason": str(e)}
 
-        chunk_size = 50
-        for i in range(0, len(paths), chunk_size):
-            chunk = paths[i : i + chunk_size]
-            chunk_results = await asyncio.gather(*[_do_delete(p) for p in chunk])
-            results.extend(chunk_results)
-
-        return results
+        # A sliding window rather than fixed batches: one slow rmtree no longer
+        # stalls the rest of its batch
+        return await asyncio.gather(*[_do_delete(p) for p in paths])
 
     async def move_copy(
         self, sources: List[str], dest_dir: Path, action: str, resolution: str
     ):
-        """Standard file operations for move/copy chunked for concurrency limits."""
+        """Standard file operations for move/copy with bounded concurrency."""
         results = {"succeeded": [], "failed": [], "conflicts": []}
+        limiter = asyncio.Semaphore(FILE_OP_CONCURRENCY)
+        # dest_dir and its ancestors, built once: a source directory in this
+        # set would be copied or moved into itself
+        dest_lineage = frozenset((dest_dir, *dest_dir.parents))
 
         async def _do_op(p_str: str) -> Dict[str, Any]:
+            async with limiter:
+                return await _op_one(p_str)
+
+        async def _op_one(p_str: str) -> Dict[str, Any]:
             res_item = {"action": "success", "val": p_str}
             try:
                 src = self.validate_path(p_str)
                 target = dest_dir / src.name
+                # One stat per side, reused by every type/existence check below
+                src_is_dir = S_ISDIR(src.stat().st_mode)
+                try:
+                    target_st = target.stat()
+                except FileNotFoundError:
+                    target_st = None
 
-                if src.is_dir() and (dest_dir == src or src in dest_dir.parents):
+                if src_is_dir and src in dest_lineage:
                     return {
                         "action": "failed",
                         "val": {
@@ -755,69 +1093,92 @@ class FileService:
                         },
                     }
 
-                if target.exists():
+                if target_st is not None:
                     if resolution == "skip":
                         return {"action": "conflict", "val": src.name}
                     elif resolution == "rename":
                         target = self.get_unique_path(target)
                     elif resolution == "overwrite":
-                        if target.is_dir():
-                            await asyncio.to_thread(shutil.rmtree, target)
+                        if S_ISDIR(target_st.st_mode):
+                            await _run_file_op(shutil.rmtree, target)
                         else:
-                            await asyncio.to_thread(target.unlink)
+                            await _run_file_op(target.unlink)
 
                 if action == "cut":
-                    await asyncio.to_thread(shutil.move, str(src), str(target))
+                    await _run_file_op(shutil.move, str(src), str(target))
                 else:
-                    if src.is_dir():
-                        await asyncio.to_thread(shutil.copytree, str(src), str(target))
+                    if src_is_dir:
+                        await _run_file_op(_parallel_copytree, str(src), str(target))
                     else:
-                        await asyncio.to_thread(shutil.copy2, str(src), str(target))
+                        await _run_file_op(_copy_file, str(src), str(target))
                 return res_item
             except Exception as e:
                 return {"action": "failed", "val": {"path": p_str, "reason": str(e)}}
 
-        chunk_size = 50
-        for i in range(0, len(sources), chunk_size):
-            chunk = sources[i : i + chunk_size]
-            chunk_results = await asyncio.gather(*[_do_op(c) for c in chunk])
-
-            for cr in chunk_results:
-                if cr["action"] == "conflict":
-                    results["conflicts"].append(cr["val"])
-                elif cr["action"] == "failed":
-                    results["failed"].append(cr["val"])
-                else:
-                    results["succeeded"].append(cr["val"])
+        for cr in await asyncio.gather(*[_do_op(c) for c in sources]):
+            if cr["action"] == "conflict":
+                results["conflicts"].append(cr["val"])
+            elif cr["action"] == "failed":
+                results["failed"].append(cr["val"])
+            else:
+                results["succeeded"].append(cr["val"])
 
         return results
 
     async def get_file_iterator(
-        self, path: Path, start: int, end: int, chunk_size: int = 65536
+        self, path: Path, start: int, end: int, chunk_size: int = STREAM_CHUNK_SIZE
     ):
         """Asynchronous iterator to read a byte range from a file."""
         try:
 
-            def _read_chunk(f_obj, size):
-                return f_obj.read(size)
-
-            f = await asyncio.to_thread(path.open, "rb")
+            def _open_at():
+                # Unbuffered: each read is one read(2) straight into the result
+                f_obj = path.open("rb", buffering=0)
+                f_obj.seek(start)
+                if hasattr(os, "posix_fadvise"):
+                    # Ranges are read front to back; widen kernel read-ahead
+                    try:
+                        os.posix_fadvise(
+                            f_obj.fileno(),
+                            start,
+                            end - start + 1,
+                            os.POSIX_FADV_SEQUENTIAL,
+                        )
+                    except OSError:
+                        pass
+                return f_obj
+
+            def _read_ahead(size):
+                return asyncio.ensure_future(asyncio.to_thread(f.read, size))
+
+            f = await asyncio.to_thread(_open_at)
+            remaining = (end - start) + 1
+            # Double-buffered: the next read runs in its thread while the
+            # current chunk is being sent
+            pending = _read_ahead(min(chunk_size, remaining))
             try:
-                await asyncio.to_thread(f.seek, start)
-                remaining = (end - start) + 1
-                while remaining > 0:
-                    chunk = await asyncio.to_thread(
-                        _read_chunk, f, min(chunk_size, remaining)
-                    )
+                while pending is not None:
+                    # Shielded: a cancelled response must not orphan the read
+                    chunk = await asyncio.shield(pending)
+                    pending = None
                     if not chunk:
                         break
                     remaining -= len(chunk)
+                    if remaining > 0:
+                        pending = _read_ahead(min(chunk_size, remaining))
                     yield chunk
             finally:
+                if pending is not None:
+                    # Never close the file under a read still running in a thread
+                    await asyncio.gather(pending, return_exceptions=True)
                 await asyncio.to_thread(f.close)
         except Exception as e:
             log.error(f"Streaming error for {path}: {e}")
 
+    async def open_path(self, path: Path):
+        """Opens a file with the system's default application, off the event loop."""
+        await asyncio.to_thread(_open_with_default_app, path)
+
     def get_unique_path(self, path: Path) -> Path:
         if not path.exists():
             return path
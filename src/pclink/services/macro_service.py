@@ -166,18 +166,8 @@ class MacroService:
             path = payload.get("path")
             if not path:
                 raise ValueError("Missing file path")
-            # We don't have 'open' in file_service yet, but we can reuse the logic
-            import os
-            import subprocess
-            import sys
-
             p = file_service.validate_path(path)
-            if sys.platform == "win32":
-                os.startfile(p)
-            elif sys.platform == "darwin":
-                subprocess.run(["open", str(p)])
-            else:
-                subprocess.run(["xdg-open", str(p)])
+            await file_service.open_path(p)
 
         else:
             raise ValueError(f"Unknown action type: {action_type}")
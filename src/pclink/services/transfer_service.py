@@ -3,15 +3,21 @@
 # Copyright (C) 2025 AZHAR ZOUHIR / BYTEDz
 
 import asyncio
-import json
+import errno
+import functools
 import logging
+import os
+import secrets
 import shutil
+import sys
 import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Dict, Optional
 
 from ..core.constants import DOWNLOADS_PATH, UPLOADS_PATH
+from ..core.utils import json_dumps_bytes, json_loads
 
 log = logging.getLogger(__name__)
 
@@ -19,6 +25,7 @@ log = logging.getLogger(__name__)
 UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
 DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
 UPLOAD_BUFFER_SIZE = 4 * 1024 * 1024  # 4MB
+UPLOAD_FD_CACHE_SIZE = 16  # Part files kept open between chunks
 
 # Storage Paths
 TEMP_UPLOAD_DIR = UPLOADS_PATH
@@ -26,19 +33,73 @@ DOWNLOAD_SESSION_DIR = DOWNLOADS_PATH
 TEMP_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 DOWNLOAD_SESSION_DIR.mkdir(parents=True, exist_ok=True)
 
+# O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
+
+def _write_at(fd: int, data, offset: int):
+    """Write all of ``data`` at ``offset`` without touching a shared file position."""
+    view = memoryview(data)
+    if hasattr(os, "pwrite"):
+        while view:
+            n = os.pwrite(fd, view, offset)
+            view = view[n:]
+            offset += n
+    else:
+        os.lseek(fd, offset, os.SEEK_SET)
+        while view:
+            view = view[os.write(fd, view) :]
+
+
+# Linux fallocate(2) via libc; os.posix_fallocate would grow st_size, which
+# resume logic relies on as the received byte count
+FALLOC_FL_KEEP_SIZE = 0x01
+_fallocate = None
+if sys.platform.startswith("linux"):
+    try:
+        import ctypes
+
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _fallocate = getattr(_libc, "fallocate64", None) or _libc.fallocate
+        _fallocate.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int64,
+            ctypes.c_int64,
+        ]
+        _fallocate.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _fallocate = None
+
+
+def _preallocate(fd: int, size: int):
+    """Reserve disk space for a known upload size without changing the file size."""
+    if _fallocate is None or size <= 0:
+        return
+    if _fallocate(fd, FALLOC_FL_KEEP_SIZE, 0, size) != 0:
+        # Unsupported filesystem or out of space; the writes will report the latter
+        log.debug(f"fallocate failed: {os.strerror(ctypes.get_errno())}")
+
 
 class TransferService:
     def __init__(self):
         # Memory State (Avoid defaultdict to prevent implicit memory leaks)
         self.active_uploads: Dict[str, Dict[str, str]] = {}
+        self.upload_sessions: Dict[str, Dict] = {}  # upload_id -> metadata
         self.active_downloads: Dict[str, Dict[str, Dict]] = {}
 
         self.transfer_locks: Dict[str, asyncio.Lock] = {}
         self._lock_creation_lock = asyncio.Lock()  # Protects dynamic lock creation
+        self._lock_users: Dict[str, int] = {}  # Holders + waiters per lock
 
         self.chunk_buffers: Dict[str, Dict[int, bytes]] = {}
         self.buffer_sizes: Dict[str, int] = {}  # Tracks memory usage per upload
         self.next_write_offset: Dict[str, int] = {}
+        # Idle part-file descriptors of recently written uploads, LRU-bounded so
+        # abandoned sessions don't pin fds (or, on Windows, lock .part files)
+        self.upload_fds: OrderedDict[str, int] = OrderedDict()
+        # API server loop that owns the state above; set when sessions restore
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     @asynccontextmanager
     async def lock(self, resource_id: str):
@@ -46,11 +107,22 @@ class TransferService:
             if resource_id not in self.transfer_locks:
                 self.transfer_locks[resource_id] = asyncio.Lock()
             lock = self.transfer_locks[resource_id]
-        async with lock:
-            yield
+            self._lock_users[resource_id] = self._lock_users.get(resource_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            # Drop the lock with its last user so per-path init locks and
+            # finished upload ids don't accumulate
+            users = self._lock_users[resource_id] - 1
+            if users:
+                self._lock_users[resource_id] = users
+            else:
+                del self._lock_users[resource_id]
+                del self.transfer_locks[resource_id]
 
     def _validate_transfer_id(self, transfer_id: str) -> str:
-        """Prevent Path Traversal by ensuring ID is a valid UUID format."""
+        """Prevent Path Traversal by ensuring ID is a hex/UUID-style token."""
         if not transfer_id or not transfer_id.replace("-", "").isalnum():
             raise ValueError("Invalid transfer ID structure.")
         return transfer_id
@@ -62,11 +134,13 @@ class TransferService:
 
     async def read_metadata(self, transfer_id: str, type: str) -> Optional[Dict]:
         meta_file, _ = self._get_files(transfer_id, type)
-        if not meta_file.exists():
-            return None
 
         def _read_sync():
-            return json.loads(meta_file.read_text(encoding="utf-8"))
+            # A missing file surfaces from the read; no separate exists() stat
+            try:
+                return json_loads(meta_file.read_bytes())
+            except FileNotFoundError:
+                return None
 
         try:
             return await asyncio.to_thread(_read_sync)
@@ -78,20 +152,45 @@ class TransferService:
         meta_file, _ = self._get_files(transfer_id, type)
 
         def _save_sync():
-            meta_file.write_text(json.dumps(data), encoding="utf-8")
+            # Write-then-rename so a crash never leaves a truncated .meta
+            tmp_file = meta_file.with_name(meta_file.name + ".tmp")
+            tmp_file.write_bytes(json_dumps_bytes(data))
+            os.replace(tmp_file, meta_file)
 
         try:
             await asyncio.to_thread(_save_sync)
         except Exception as e:
             log.error(f"Failed to save session {transfer_id}: {e}")
 
+    async def get_upload_session(self, upload_id: str) -> Optional[Dict]:
+        """Upload metadata from memory, falling back to the .meta file once."""
+        meta = self.upload_sessions.get(upload_id)
+        if meta is None:
+            meta = await self.read_metadata(upload_id, "upload")
+            if meta is None:
+                return None
+            # cleanup_session unlinks the files before dropping the entry
+            # under this lock, so re-checking here can't revive a dead session
+            async with self._lock_creation_lock:
+                meta_file, _ = self._get_files(upload_id, "upload")
+                if not meta_file.exists():
+                    return self.upload_sessions.get(upload_id)
+                meta = self.upload_sessions.setdefault(upload_id, meta)
+        return meta
+
     def verify_ownership(self, metadata: Dict, client_id: str) -> bool:
         return metadata.get("client_id") == client_id
 
     async def get_received_bytes(self, upload_id: str) -> int:
         """Public accessor for partial file size to avoid leaky abstractions."""
+        fd = self.upload_fds.get(upload_id)
+        if fd is not None:
+            return os.fstat(fd).st_size
         _, part = self._get_files(upload_id, "upload")
-        return part.stat().st_size if part.exists() else 0
+        try:
+            return part.stat().st_size
+        except FileNotFoundError:
+            return 0
 
     async def cleanup_session(self, transfer_id: str, type: str = "upload"):
         meta_file, part_file = self._get_files(transfer_id, type)
@@ -100,17 +199,62 @@ class TransferService:
             meta_file.unlink(missing_ok=True)
             part_file.unlink(missing_ok=True)
 
+        # An open descriptor would block the unlink on Windows
+        self._close_upload_fd(transfer_id)
         await asyncio.to_thread(_unlink_sync)
 
         # Ensure complete memory footprint cleanup
         async with self._lock_creation_lock:
+            self.upload_sessions.pop(transfer_id, None)
             self.chunk_buffers.pop(transfer_id, None)
             self.buffer_sizes.pop(transfer_id, None)
             self.next_write_offset.pop(transfer_id, None)
-            self.transfer_locks.pop(transfer_id, None)
 
     # --- UPLOAD ---
 
+    def _cache_upload_fd(self, upload_id: str, fd: int):
+        self.upload_fds[upload_id] = fd
+        while len(self.upload_fds) > UPLOAD_FD_CACHE_SIZE:
+            _, oldest = self.upload_fds.popitem(last=False)
+            try:
+                os.close(oldest)
+            except OSError:
+                pass
+
+    def _adopt_upload_fd(self, upload_id: str, write: asyncio.Future):
+        """Cache the fd from a write whose request was cancelled, or close it."""
+        if write.cancelled() or write.exception() is not None:
+            if not write.cancelled():
+                log.error(f"Chunk write failed for {upload_id}: {write.exception()}")
+            # Re-derive the resume point from the part file on the next chunk
+            self.next_write_offset.pop(upload_id, None)
+            return
+        fd = write.result()
+        if upload_id in self.upload_sessions and upload_id not in self.upload_fds:
+            self._cache_upload_fd(upload_id, fd)
+        else:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _close_upload_fd(self, upload_id: str):
+        fd = self.upload_fds.pop(upload_id, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def untrack_upload(self, client_id: str, final_path: str):
+        """Drop an upload from the resume index without a check-then-act race."""
+        uploads = self.active_uploads.get(client_id)
+        if uploads is None:
+            return
+        uploads.pop(final_path, None)
+        if not uploads:  # Clean empty client dicts
+            self.active_uploads.pop(client_id, None)
+
     async def initiate_upload(
         self,
         client_id: str,
@@ -140,19 +284,14 @@ class TransferService:
 
         async with self.lock(f"init_{final_path_str}"):
             # Resume capability
-            if (
-                client_id in self.active_uploads
-                and final_path_str in self.active_uploads[client_id]
-            ):
-                exist_id = self.active_uploads[client_id][final_path_str]
+            exist_id = self.active_uploads.get(client_id, {}).get(final_path_str)
+            if exist_id:
                 _, part = self._get_files(exist_id, "upload")
                 if part.exists():
                     return {"upload_id": exist_id, "final_file_name": final_path.name}
 
             # New session
-            import uuid
-
-            upload_id = str(uuid.uuid4())
+            upload_id = secrets.token_hex(16)
             meta = {
                 "client_id": client_id,
                 "final_path": final_path_str,
@@ -162,16 +301,20 @@ class TransferService:
                 "status": "active",
             }
             await self.save_metadata(upload_id, meta, "upload")
+            self.upload_sessions[upload_id] = meta
             _, part = self._get_files(upload_id, "upload")
 
             def _init_part_sync():
-                part.write_bytes(b"")
+                fd = os.open(part, _WRITE_FLAGS | os.O_CREAT | os.O_TRUNC, 0o666)
+                try:
+                    _preallocate(fd, file_size)
+                finally:
+                    # Reopened by the first chunk; queued sessions hold no fd
+                    os.close(fd)
 
             await asyncio.to_thread(_init_part_sync)
 
-            if client_id not in self.active_uploads:
-                self.active_uploads[client_id] = {}
-            self.active_uploads[client_id][final_path_str] = upload_id
+            self.active_uploads.setdefault(client_id, {})[final_path_str] = upload_id
 
             self.next_write_offset[upload_id] = 0
             self.chunk_buffers[upload_id] = {}
@@ -181,6 +324,10 @@ class TransferService:
 
     async def write_chunk(self, upload_id: str, offset: int, data: bytes) -> Dict:
         async with self.lock(upload_id):
+            # Cancelled or completed while this chunk waited for the lock
+            if await self.get_upload_session(upload_id) is None:
+                raise FileNotFoundError("Session not found")
+
             if upload_id not in self.chunk_buffers:
                 self.chunk_buffers[upload_id] = {}
                 self.buffer_sizes[upload_id] = 0
@@ -218,13 +365,43 @@ class TransferService:
                 curr += len(chunk)
 
             if chunks_to_write:
-                combined_data = b"".join(chunks_to_write)
+                # In-order uploads usually flush exactly one chunk; skip the copy
+                combined_data = (
+                    chunks_to_write[0]
+                    if len(chunks_to_write) == 1
+                    else b"".join(chunks_to_write)
+                )
 
-                def _append_sync():
-                    with part_file.open("ab") as f:
-                        f.write(combined_data)
+                # Checked out of the cache while in use, so LRU eviction only
+                # ever closes idle descriptors
+                fd = self.upload_fds.pop(upload_id, None)
 
-                await asyncio.to_thread(_append_sync)
+                def _write_sync(fd=fd):
+                    if fd is None:
+                        fd = os.open(part_file, _WRITE_FLAGS)
+                    try:
+                        _write_at(fd, combined_data, expected)
+                    except BaseException:
+                        os.close(fd)
+                        raise
+                    return fd
+
+                write = asyncio.ensure_future(asyncio.to_thread(_write_sync))
+                try:
+                    fd = await asyncio.shield(write)
+                except asyncio.CancelledError:
+                    # Client went away mid-write. The thread still finishes and
+                    # hands back a descriptor: adopt it when it lands, and hold
+                    # the lock until then so cancel/complete can't unlink or
+                    # rename the part file under it
+                    write.add_done_callback(
+                        functools.partial(self._adopt_upload_fd, upload_id)
+                    )
+                    self.next_write_offset[upload_id] = curr
+                    self.buffer_sizes[upload_id] -= written
+                    await asyncio.wait([write])
+                    raise
+                self._cache_upload_fd(upload_id, fd)
 
                 self.next_write_offset[upload_id] = curr
                 self.buffer_sizes[upload_id] -= written
@@ -233,7 +410,7 @@ class TransferService:
 
     async def complete_upload(self, upload_id: str):
         async with self.lock(upload_id):
-            meta = await self.read_metadata(upload_id, "upload")
+            meta = await self.get_upload_session(upload_id)
             if not meta:
                 raise FileNotFoundError("Session not found")
 
@@ -246,24 +423,32 @@ class TransferService:
             if (sz := meta.get("file_size")) and part_file.stat().st_size != sz:
                 raise ValueError("Final size mismatch")
 
+            # Must be closed before the rename on Windows
+            self._close_upload_fd(upload_id)
+
             # Execute blocking folder/file creation in thread
             def _finalize_file():
                 final_path.parent.mkdir(parents=True, exist_ok=True)
-                if final_path.exists():
-                    final_path.unlink()
-                shutil.move(str(part_file), str(final_path))
+                try:
+                    # Atomic and overwrites on both POSIX and Windows
+                    os.replace(part_file, final_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(str(part_file), str(final_path))
 
             await asyncio.to_thread(_finalize_file)
 
-            cid = meta["client_id"]
-            if cid in self.active_uploads:
-                self.active_uploads[cid].pop(str(final_path), None)
-                if not self.active_uploads[cid]:  # Clean empty client dicts
-                    del self.active_uploads[cid]
-
+            self.untrack_upload(meta["client_id"], meta["final_path"])
             await self.cleanup_session(upload_id, "upload")
             return str(final_path)
 
+    async def cancel_upload(self, upload_id: str):
+        # Wait out any in-flight write, and keep queued ones out until the
+        # session is gone (they would otherwise reopen the part file)
+        async with self.lock(upload_id):
+            await self.cleanup_session(upload_id, "upload")
+
     # --- DOWNLOAD ---
 
     async def initiate_download(self, client_id: str, file_path: str):
@@ -274,9 +459,7 @@ class TransferService:
             raise FileNotFoundError("File not found")
 
         stat = path.stat()
-        import uuid
-
-        dl_id = str(uuid.uuid4())
+        dl_id = secrets.token_hex(16)
         session = {
             "client_id": client_id,
             "file_path": str(path),
@@ -296,26 +479,90 @@ class TransferService:
         return {"download_id": dl_id, "file_size": stat.st_size, "file_name": path.name}
 
     async def cleanup_stale_sessions(self, threshold_days: int = 7) -> int:
-        """Deletes session files older than the specified threshold."""
-        threshold_seconds = threshold_days * 24 * 60 * 60
-        current_time = time.time()
-        deleted_count = 0
-
-        for dir_path in [TEMP_UPLOAD_DIR, DOWNLOAD_SESSION_DIR]:
-            if not dir_path.exists():
-                continue
-            for f in dir_path.glob("*"):
-                if f.is_file() and (
-                    current_time - f.stat().st_mtime > threshold_seconds
-                ):
+        """Deletes sessions older than the threshold, on disk and in memory."""
+        cutoff = time.time() - threshold_days * 24 * 60 * 60
+
+        def _find_stale():
+            # Group by session id: the .meta of a long upload is old while its
+            # .part is still being written, so only the newest file counts
+            sessions: Dict[str, list] = {}
+            newest: Dict[str, float] = {}
+            for dir_path in (TEMP_UPLOAD_DIR, DOWNLOAD_SESSION_DIR):
+                try:
+                    with os.scandir(dir_path) as it:
+                        for entry in it:
+                            try:
+                                if not entry.is_file():
+                                    continue
+                                mtime = entry.stat().st_mtime
+                            except OSError:
+                                continue
+                            tid = entry.name.split(".", 1)[0]
+                            sessions.setdefault(tid, []).append(entry.path)
+                            newest[tid] = max(newest.get(tid, 0), mtime)
+                except FileNotFoundError:
+                    continue
+            return {
+                tid: files for tid, files in sessions.items() if newest[tid] < cutoff
+            }
+
+        stale = await asyncio.to_thread(_find_stale)
+        if not stale:
+            return 0
+
+        # Drop descriptors and memory state first; Windows can't unlink open files.
+        # That state belongs to the API loop, so callers running their own loop
+        # (repair auto-heal on the watchdog thread) hand the prune over to it.
+        ids = list(stale)
+        owner = self._loop
+        if owner is None or owner is asyncio.get_running_loop():
+            await self._forget_sessions(ids)
+        elif owner.is_running():
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self._forget_sessions(ids), owner)
+            )
+
+        def _unlink_stale():
+            deleted = 0
+            for files in stale.values():
+                for f in files:
                     try:
-                        f.unlink()
-                        deleted_count += 1
+                        os.unlink(f)
+                        deleted += 1
+                    except FileNotFoundError:
+                        pass
                     except Exception as e:
                         log.error(f"Failed to delete stale file {f}: {e}")
-        return deleted_count
+            return deleted
+
+        return await asyncio.to_thread(_unlink_stale)
+
+    async def _forget_sessions(self, transfer_ids):
+        """Prune in-memory state of sessions whose files are being removed."""
+        ids = set(transfer_ids)
+        for tid in ids:
+            # Under the session lock so no in-flight write loses its descriptor
+            async with self.lock(tid):
+                self._close_upload_fd(tid)
+                self.upload_sessions.pop(tid, None)
+                self.chunk_buffers.pop(tid, None)
+                self.buffer_sizes.pop(tid, None)
+                self.next_write_offset.pop(tid, None)
+
+        for cid, uploads in list(self.active_uploads.items()):
+            for path, uid in list(uploads.items()):
+                if uid in ids:
+                    self.untrack_upload(cid, path)
+
+        for cid, downloads in list(self.active_downloads.items()):
+            for did in ids.intersection(downloads):
+                downloads.pop(did, None)
+            if not downloads:
+                self.active_downloads.pop(cid, None)
 
     async def restore_sessions(self):
+        # Runs in the API lifespan: remember the loop that owns transfer state
+        self._loop = asyncio.get_running_loop()
         # Scan disk for active sessions on startup
         count_up = 0
         count_down = 0
@@ -323,7 +570,7 @@ class TransferService:
         # Uploads
         for f in TEMP_UPLOAD_DIR.glob("*.meta"):
             try:
-                data = json.loads(f.read_text("utf-8"))
+                data = json_loads(f.read_bytes())
                 if data.get("status") == "active":
                     cli = data["client_id"]
                     if cli not in self.active_uploads:
@@ -336,7 +583,7 @@ class TransferService:
         # Downloads
         for f in DOWNLOAD_SESSION_DIR.glob("*.meta"):
             try:
-                data = json.loads(f.read_text("utf-8"))
+                data = json_loads(f.read_bytes())
                 if data.get("status") == "active":
                     cli = data["client_id"]
                     if cli not in self.active_downloads:
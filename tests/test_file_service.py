@@ -0,0 +1,39 @@
+"""Tests for the file service."""
+
+import asyncio
+import importlib
+import zipfile
+
+import pytest
+
+file_service_module = importlib.import_module("pclink.services.file_service")
+
+
+def _extract(zip_path, dest):
+    async def _run():
+        gen = await file_service_module.file_service.extract(zip_path, dest)
+        return list(gen)
+
+    return asyncio.run(_run())
+
+
+@pytest.mark.parametrize("is_windows", [False, True])
+def test_extract_nested_archive_with_parallel_workers(
+    tmp_path, monkeypatch, is_windows
+):
+    # Workers race to create shared parent directories
+    monkeypatch.setattr(file_service_module, "EXTRACT_WORKERS", 4)
+    monkeypatch.setattr(file_service_module, "IS_WINDOWS", is_windows)
+
+    zip_path = tmp_path / "nested.zip"
+    names = [f"d{d}/s/t/f{f}.txt" for d in range(5) for f in range(10)]
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for name in names:
+            zf.writestr(name, name * 100)
+
+    for run in range(10):
+        dest = tmp_path / f"out{run}"
+        progress = _extract(zip_path, dest)
+        assert progress[-1] == 100
+        for name in names:
+            assert (dest / name).read_text() == name * 100